@@ -0,0 +1,5 @@
+# A User-Agent sent on HTTP requests.
+#
+# The web app uses this for its ``USER_AGENT`` setting too, but it lives
+# here so API clients can use it without an app context.
+USER_AGENT = "Flickypedia/0.1 (https://commons.wikimedia.org/wiki/Commons:Flickypedia; hello@flickr.org)"
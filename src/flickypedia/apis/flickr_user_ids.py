@@ -31,19 +31,25 @@ come up empty.
 
 Instead, we do a one-off query for _all_ the Wikidata entities that
 have the Flickr user ID property.  This can be cached in-memory (it's
-small, only ~86KB of JSON) and then looked up for the lifetime of
-the program.
+small, only ~86KB of JSON) and then looked up for the next 24 hours,
+after which we fetch a fresh copy -- so a long-running web app will
+eventually see users who've been added to Wikidata since it started.
 
 """
 
-import functools
 import re
+import threading
+import time
 from typing import TypedDict
 
 from flickr_photos_api import User as FlickrUser
 import httpx
+import orjson
 
-from flickypedia.apis.structured_data.wikidata import WikidataProperties
+from flickypedia.apis.structured_data.wikidata import (
+    get_http_client,
+    WikidataProperties,
+)
 
 
 def lookup_flickr_user_in_wikidata(user: FlickrUser) -> str | None:
@@ -53,12 +59,21 @@ def lookup_flickr_user_in_wikidata(user: FlickrUser) -> str | None:
 
     Otherwise, return None.
     """
+    # Every user ID in the lookup table looks like a Flickr user ID, so
+    # if this user's ID doesn't and they have no path alias, there's
+    # nothing to find -- and we can skip fetching the table entirely.
+    has_valid_user_id = is_flickr_user_id(user["id"])
+
+    if not has_valid_user_id and user["path_alias"] is None:
+        return None
+
     lookup = find_wikidata_entities_with_flickr_ids()
 
-    try:
-        return lookup["by_user_id"][user["id"]]
-    except KeyError:
-        pass
+    if has_valid_user_id:
+        try:
+            return lookup["by_user_id"][user["id"]]
+        except KeyError:
+            pass
 
     if user["path_alias"] is not None:
         try:
@@ -69,6 +84,9 @@ def lookup_flickr_user_in_wikidata(user: FlickrUser) -> str | None:
     return None
 
 
+_FLICKR_USER_ID_RE = re.compile(r"^[0-9]{5,11}@N[0-9]{2}$")
+
+
 def is_flickr_user_id(s: str) -> bool:
     """
     Returns True if a string looks like a Flickr user ID.
@@ -80,7 +98,7 @@ def is_flickr_user_id(s: str) -> bool:
         False
 
     """
-    return re.match(r"^[0-9]{5,11}@N[0-9]{2}$", s) is not None
+    return _FLICKR_USER_ID_RE.match(s) is not None
 
 
 class WikidataEntityLookup(TypedDict):
@@ -88,8 +106,95 @@ class WikidataEntityLookup(TypedDict):
     by_pathalias: dict[str, str]
 
 
-@functools.cache
+# A SPARQL query to find all the Wikidata entities that have
+# the Flickr user ID property.
+#
+# This is based on https://www.wikidata.org/wiki/Wikidata:SPARQL_query_service/queries/examples#All_items_with_a_property
+#
+# Note: the query is sent as a URL parameter, so changing the whitespace
+# here will change the URL and invalidate the VCR cassettes in the tests.
+FLICKR_USER_ID_QUERY = f"""
+                SELECT ?item ?value
+                WHERE {{ ?item wdt:{WikidataProperties.FlickrUserId} ?value }}
+                LIMIT 5000
+            """
+
+# How long we keep the lookup table before fetching it again, in seconds.
+CACHE_TTL = 24 * 60 * 60
+
+# If we can't fetch a fresh copy of the lookup table, how long we keep
+# using the old copy before trying again, in seconds.
+RETRY_AFTER_ERROR = 60 * 60
+
+_refresh_lock = threading.Lock()
+_cached_lookup: tuple[float, WikidataEntityLookup] | None = None
+
+
 def find_wikidata_entities_with_flickr_ids() -> WikidataEntityLookup:
+    """
+    Returns a dictionary that maps Flickr user IDs to Wikidata entity IDs.
+
+    The result is cached for ``CACHE_TTL`` seconds.  If we can't fetch
+    a fresh copy when the cache expires, we keep using the old copy
+    and try again after ``RETRY_AFTER_ERROR`` seconds.
+    """
+    global _cached_lookup
+
+    cached = _cached_lookup
+
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+
+    # Only one thread fetches a new table at a time.  The fetch can take
+    # a while, so if we already have a stale table, other threads keep
+    # using it rather than waiting -- they only wait if there's no table.
+    if cached is None:
+        _refresh_lock.acquire()
+    elif not _refresh_lock.acquire(blocking=False):
+        return cached[1]
+
+    try:
+        # Another thread may have fetched a new table while we were
+        # waiting for the lock, in which case we can use that.
+        cached = _cached_lookup
+
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+            return cached[1]
+
+        try:
+            lookup = _fetch_wikidata_entities_with_flickr_ids()
+        except (httpx.HTTPError, orjson.JSONDecodeError, KeyError):
+            if cached is None:
+                raise
+
+            # A stale lookup table is much better than failing to create
+            # structured data, so keep the old table -- but mark it as
+            # expiring soon, so we try to refresh it again later.
+            _, lookup = cached
+            _cached_lookup = (
+                time.monotonic() - CACHE_TTL + RETRY_AFTER_ERROR,
+                lookup,
+            )
+            return lookup
+
+        _cached_lookup = (time.monotonic(), lookup)
+
+        return lookup
+    finally:
+        _refresh_lock.release()
+
+
+def clear_user_cache() -> None:
+    """
+    Discard the cached lookup table, so the next lookup will query
+    Wikidata again.
+    """
+    global _cached_lookup
+
+    _cached_lookup = None
+
+
+def _fetch_wikidata_entities_with_flickr_ids() -> WikidataEntityLookup:
     """
     Creates a dictionary that maps Flickr user IDs to Wikidata entity IDs.
     """
@@ -98,24 +203,21 @@ def find_wikidata_entities_with_flickr_ids() -> WikidataEntityLookup:
         "by_pathalias": {},
     }
 
-    # Run a SPARQL query to find all the Wikidata entities that have
-    # the Flickr photo ID property.
+    # The query service varies its responses on the Accept header, so we
+    # send an explicit value -- this means we always get the same cached
+    # variant, rather than depending on whatever default httpx sends.
     #
-    # This is based on https://www.wikidata.org/wiki/Wikidata:SPARQL_query_service/queries/examples#All_items_with_a_property
-    resp = httpx.get(
+    # This is a big query that can take a while to run, so we give it
+    # more time than the default timeout on the shared client.
+    resp = get_http_client().get(
         "https://query.wikidata.org/sparql",
-        params={
-            "format": "json",
-            "query": """
-                SELECT ?item ?value
-                WHERE { ?item wdt:%s ?value }
-                LIMIT 5000
-            """
-            % WikidataProperties.FlickrUserId,
-        },
+        params={"format": "json", "query": FLICKR_USER_ID_QUERY},
+        headers={"Accept": "application/sparql-results+json"},
+        timeout=30,
     )
+    resp.raise_for_status()
 
-    for entity in resp.json()["results"]["bindings"]:
+    for entity in orjson.loads(resp.content)["results"]["bindings"]:
         # Each entity will be a dict something of the form:
         #
         #     {
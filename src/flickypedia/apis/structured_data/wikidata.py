@@ -1,11 +1,14 @@
+import atexit
 import datetime
 import functools
 import re
-from typing import Literal
+from typing import Final, Literal
 
 from flask import current_app
 import httpx
+import orjson
 
+from flickypedia.apis import USER_AGENT
 from flickypedia.types.structured_data import DataValueTypes, Value
 
 
@@ -18,24 +21,24 @@ class WikidataProperties:
     # https://www.wikidata.org/wiki/Property:<PROPERTY_ID>
     #
     # e.g. https://www.wikidata.org/wiki/Property:P2093
-    Operator = "P137"
-    AppliesToJurisdiction = "P1001"
-    Creator = "P170"
-    DescribedAtUrl = "P973"
-    DeterminationMethod = "P459"
-    AuthorName = "P2093"
-    CoordinatesOfThePointOfView = "P1259"
-    FlickrPhotoId = "P12120"
-    FlickrUserId = "P3267"
-    Url = "P2699"
-    SourceOfFile = "P7482"
-    CopyrightLicense = "P275"
-    CopyrightStatus = "P6216"
-    Inception = "P571"
-    PublicationDate = "P577"
-    PublishedIn = "P1433"
-    Retrieved = "P813"
-    SourcingCircumstances = "P1480"
+    Operator: Final = "P137"
+    AppliesToJurisdiction: Final = "P1001"
+    Creator: Final = "P170"
+    DescribedAtUrl: Final = "P973"
+    DeterminationMethod: Final = "P459"
+    AuthorName: Final = "P2093"
+    CoordinatesOfThePointOfView: Final = "P1259"
+    FlickrPhotoId: Final = "P12120"
+    FlickrUserId: Final = "P3267"
+    Url: Final = "P2699"
+    SourceOfFile: Final = "P7482"
+    CopyrightLicense: Final = "P275"
+    CopyrightStatus: Final = "P6216"
+    Inception: Final = "P571"
+    PublicationDate: Final = "P577"
+    PublishedIn: Final = "P1433"
+    Retrieved: Final = "P813"
+    SourcingCircumstances: Final = "P1480"
 
 
 class WikidataEntities:
@@ -47,20 +50,20 @@ class WikidataEntities:
     # https://www.wikidata.org/wiki/<ENTITY_ID>
     #
     # e.g. https://www.wikidata.org/wiki/Q103204
-    Circa = "Q5727902"
-    Copyrighted = "Q50423863"
-    DedicatedToPublicDomainByCopyrightOwner = "Q88088423"
-    FileAvailableOnInternet = "Q74228490"
-    Flickr = "Q103204"
-    GregorianCalendar = "Q1985727"
-    PublicDomain = "Q19652"
-    StatedByCopyrightHolderAtSourceWebsite = "Q61045577"
-    UnitedStatesOfAmerica = "Q30"
-    WorkOfTheFederalGovernmentOfTheUnitedStates = "Q60671452"
+    Circa: Final = "Q5727902"
+    Copyrighted: Final = "Q50423863"
+    DedicatedToPublicDomainByCopyrightOwner: Final = "Q88088423"
+    FileAvailableOnInternet: Final = "Q74228490"
+    Flickr: Final = "Q103204"
+    GregorianCalendar: Final = "Q1985727"
+    PublicDomain: Final = "Q19652"
+    StatedByCopyrightHolderAtSourceWebsite: Final = "Q61045577"
+    UnitedStatesOfAmerica: Final = "Q30"
+    WorkOfTheFederalGovernmentOfTheUnitedStates: Final = "Q60671452"
 
     # We only map the license types used by Flickypedia -- we should
     # never be creating SDC for e.g. CC BY-NC.
-    Licenses = {
+    Licenses: Final = {
         "cc-by-2.0": "Q19125117",
         "cc-by-sa-2.0": "Q19068220",
         "cc0-1.0": "Q6938433",
@@ -76,9 +79,9 @@ class WikidataDatePrecision:
     See https://www.wikidata.org/wiki/Help:Dates#Precision
     """
 
-    Year = 9
-    Month = 10
-    Day = 11
+    Year: Final = 9
+    Month: Final = 10
+    Day: Final = 11
 
 
 @functools.lru_cache
@@ -109,6 +112,27 @@ def get_property_name(code: str) -> str:
         raise KeyError
 
 
+@functools.cache
+def get_http_client() -> httpx.Client:
+    """
+    Returns a shared HTTP client for talking to Wikidata.
+
+    Sharing a client means requests can reuse pooled connections, rather
+    than paying for a new TLS handshake every time.  We create it on
+    first use, because creating a client loads the SSL context, which
+    is slow, and most processes never talk to Wikidata.
+    """
+    client = httpx.Client(
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(
+            max_keepalive_connections=20, max_connections=40, keepalive_expiry=60
+        ),
+    )
+    atexit.register(client.close)
+
+    return client
+
+
 @functools.lru_cache
 def get_entity_label(entity_id: str) -> str | None:
     """
@@ -118,30 +142,37 @@ def get_entity_label(entity_id: str) -> str | None:
     returns labels in multiple languages.  This might be a good point
     to do some internationalisation.
     """
-    resp = httpx.get(
+    resp = get_http_client().get(
         f"https://www.wikidata.org/w/rest.php/wikibase/v0/entities/items/{entity_id}",
         headers={"User-Agent": current_app.config["USER_AGENT"]},
     )
 
     try:
         resp.raise_for_status()
-        return resp.json()["labels"]["en"]  # type: ignore
+        return orjson.loads(resp.content)["labels"]["en"]  # type: ignore
     except Exception:  # pragma: no cover
         return None
 
 
-def to_wikidata_date_value(
-    d: datetime.datetime, *, precision: Literal["day", "month", "year"]
-) -> DataValueTypes.Time:
-    """
-    Convert a Python native-datetime to the Wikidata data model.
+# This tells Wikidata which calendar we're using.
+#
+# Although this is the default, the API throws an error if you try
+# to store a date without it, so we include it on every date.
+GREGORIAN_CALENDAR_MODEL = (
+    f"http://www.wikidata.org/entity/{WikidataEntities.GregorianCalendar}"
+)
 
-    See https://www.wikidata.org/wiki/Help:Dates#Precision
+
+@functools.lru_cache(maxsize=4096)
+def _to_wikidata_time(
+    d: datetime.date, precision: Literal["day", "month", "year"]
+) -> tuple[str, int]:
     """
-    assert precision in ("day", "month", "year")
+    Returns the timestamp and numeric precision for a date in the
+    Wikidata model, e.g. ``("+2023-10-11T00:00:00Z", 11)``.
 
-    # This is the timestamp, e.g. ``+2023-10-11T00:00:00Z``.
-    #
+    Most photos in a batch share a handful of dates, so we cache this.
+    """
     # We zero the hour/minute/second even if we have that precision
     # in our datetime because of a limitation in Wikidata.
     # In particular, as of 12 October 2023:
@@ -155,17 +186,26 @@ def to_wikidata_date_value(
     # Note: the decision to zero the unused fields is to match the
     # behaviour of the SDC visual editor in the browser -- if you
     # set a value with e.g. month precision, the day is set to "00".
-    time_str = {
-        "day": d.strftime("+%Y-%m-%dT00:00:00Z"),
-        "month": d.strftime("+%Y-%m-00T00:00:00Z"),
-        "year": d.strftime("+%Y-00-00T00:00:00Z"),
-    }[precision]
-
-    precision_value = {
-        "day": WikidataDatePrecision.Day,
-        "month": WikidataDatePrecision.Month,
-        "year": WikidataDatePrecision.Year,
-    }[precision]
+    if precision == "day":
+        return (d.strftime("+%Y-%m-%dT00:00:00Z"), WikidataDatePrecision.Day)
+    elif precision == "month":
+        return (d.strftime("+%Y-%m-00T00:00:00Z"), WikidataDatePrecision.Month)
+    else:
+        return (d.strftime("+%Y-00-00T00:00:00Z"), WikidataDatePrecision.Year)
+
+
+def to_wikidata_date_value(
+    d: datetime.datetime, *, precision: Literal["day", "month", "year"]
+) -> DataValueTypes.Time:
+    """
+    Convert a Python native-datetime to the Wikidata data model.
+
+    See https://www.wikidata.org/wiki/Help:Dates#Precision
+    """
+    assert precision in ("day", "month", "year")
+
+    # This is the timestamp, e.g. ``+2023-10-11T00:00:00Z``.
+    time_str, precision_value = _to_wikidata_time(d.date(), precision)
 
     # This is the numeric offset from UTC in minutes.  All the timestamps
     # we get from Flickr are in UTC, so we can default this to 0.
@@ -182,14 +222,6 @@ def to_wikidata_date_value(
     # so we include default values.
     before = after = 0
 
-    # This tells Wikidata which calendar we're using.
-    #
-    # Although this is the default, the API throws an error if you try
-    # to store a date without it, so we include it here.
-    calendarmodel = (
-        f"http://www.wikidata.org/entity/{WikidataEntities.GregorianCalendar}"
-    )
-
     return {
         "value": {
             "time": time_str,
@@ -197,7 +229,7 @@ def to_wikidata_date_value(
             "timezone": timezone,
             "before": before,
             "after": after,
-            "calendarmodel": calendarmodel,
+            "calendarmodel": GREGORIAN_CALENDAR_MODEL,
         },
         "type": "time",
     }
@@ -230,10 +262,7 @@ def render_wikidata_date(value: Value.Time) -> str:
     """
     Given a Wikidata date from the SDC, render it as text.
     """
-    assert (
-        value["calendarmodel"]
-        == f"http://www.wikidata.org/entity/{WikidataEntities.GregorianCalendar}"
-    )
+    assert value["calendarmodel"] == GREGORIAN_CALENDAR_MODEL
     assert value["precision"] in {11, 10, 9}
 
     # This is the numeric value of precision used in the Wikidata model.
@@ -6,7 +6,6 @@ import uuid
 from flask import current_app, Flask, request
 from flickr_photos_api import FlickrPhotosApi
 from jinja2 import StrictUndefined
-import sass
 
 from .auth import (
     login,
@@ -68,6 +67,22 @@ def create_app(
 ) -> Flask:
     app = Flask(__name__)
 
+    # We set the Jinja options before anything touches ``app.jinja_env``,
+    # so the environment is created with them, rather than being
+    # modified after it's been created.
+    app.jinja_options = {
+        **app.jinja_options,
+        #
+        # This option causes Jinja to throw if we use an undefined variable
+        # in one of the templates.
+        # See https://alexwlchan.net/2022/strict-jinja/
+        "undefined": StrictUndefined,
+        #
+        # This causes Jinja to remove extraneous whitespace.
+        "trim_blocks": True,
+        "lstrip_blocks": True,
+    }
+
     config = create_config(data_directory)
 
     app.config.update(**config)
@@ -78,8 +93,12 @@ def create_app(
     with app.app_context():
         user_db.create_all()
 
+    # Usually these directories already exist, so we check first --
+    # that's a single stat() call, whereas ``os.makedirs`` would try
+    # (and fail) to create the directory before checking it's there.
     for dirname in get_directories(app.config):
-        os.makedirs(dirname, exist_ok=True)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname, exist_ok=True)
 
     app.add_url_rule("/", view_func=homepage)
 
@@ -118,24 +137,26 @@ def create_app(
         "/api/post_user_comment", view_func=post_user_comment_api, methods=["POST"]
     )
 
-    app.jinja_env.filters["html_unescape"] = html.unescape
-    app.jinja_env.filters["size_at"] = size_at
-    app.jinja_env.filters["link_to_commons"] = create_link_to_commons
-    app.jinja_env.filters["truncate_description"] = truncate_description
-    app.jinja_env.filters["bookmarklet"] = create_bookmarklet
-
-    app.jinja_env.filters["wikidata_property_name"] = get_property_name
-    app.jinja_env.filters["wikidata_entity_label"] = get_entity_label
-    app.jinja_env.filters["wikidata_date"] = render_wikidata_date
-
-    app.jinja_env.filters["bot_comment_text"] = create_bot_comment_text
-    app.jinja_env.filters[
-        "default_user_comment_text"
-    ] = create_default_user_comment_text
-    app.jinja_env.filters["buddy_icon"] = buddy_icon
+    app.jinja_env.filters.update(
+        {
+            "html_unescape": html.unescape,
+            "size_at": size_at,
+            "link_to_commons": create_link_to_commons,
+            "truncate_description": truncate_description,
+            "bookmarklet": create_bookmarklet,
+            #
+            "wikidata_property_name": get_property_name,
+            "wikidata_entity_label": get_entity_label,
+            "wikidata_date": render_wikidata_date,
+            #
+            "bot_comment_text": create_bot_comment_text,
+            "default_user_comment_text": create_default_user_comment_text,
+            "buddy_icon": buddy_icon,
+        }
+    )
 
-    # Compile the CSS.  If we're running in debug mode, rebuild it on
-    # every request for convenience.
+    # Compile the CSS.  If we're running in debug mode, check whether it
+    # needs rebuilding on every request for the stylesheet, for convenience.
     static_folder: str = app.static_folder  # type: ignore
 
     compile_scss(static_folder)
@@ -147,25 +168,28 @@ def create_app(
             if request.path == "/static/style.css":
                 compile_scss(static_folder)
 
-    # This option causes Jinja to throw if we use an undefined variable
-    # in one of the templates.
-    # See https://alexwlchan.net/2022/strict-jinja/
-    app.jinja_env.undefined = StrictUndefined
-
-    # This causes Jinja to remove extraneous whitespace.
-    app.jinja_env.trim_blocks = True
-    app.jinja_env.lstrip_blocks = True
-
     return app
 
 
 def compile_scss(static_folder: str) -> None:
     """
     Compile the SCSS file into static.css.
+
+    If the CSS file is newer than every SCSS file, it's already up-to-date
+    and we skip compiling it again.
     """
-    sass_path = os.path.join(static_folder, "assets", "style.scss")
+    assets_folder = os.path.join(static_folder, "assets")
+    sass_path = os.path.join(assets_folder, "style.scss")
     css_path = os.path.join(static_folder, "style.css")
 
+    if is_css_up_to_date(css_path=css_path, assets_folder=assets_folder):
+        return
+
+    # We import libsass here rather than at the top of the file, so
+    # processes that never need to compile the CSS (e.g. a worker which
+    # starts after the CSS is already up-to-date) don't pay to load it.
+    import sass
+
     # We want to write the CSS to a temporary file first, then atomically
     # rename it into place -- this avoids the server sending a user
     # a partially-complete CSS file.
@@ -177,7 +201,29 @@ def compile_scss(static_folder: str) -> None:
     with open(tmp_path, "w") as out_file:
         out_file.write(sass.compile(filename=sass_path))
 
-    os.rename(tmp_path, css_path)
+    os.replace(tmp_path, css_path)
+
+
+def is_css_up_to_date(*, css_path: str, assets_folder: str) -> bool:
+    """
+    Returns True if the compiled CSS is newer than all of the SCSS files
+    it's built from, False otherwise.
+
+    All of our partials live alongside ``style.scss`` in the assets
+    folder, so we look at the modification time of every SCSS file
+    in that folder.
+    """
+    try:
+        css_mtime = os.path.getmtime(css_path)
+    except FileNotFoundError:
+        return False
+
+    with os.scandir(assets_folder) as entries:
+        scss_mtime = max(
+            entry.stat().st_mtime for entry in entries if entry.name.endswith(".scss")
+        )
+
+    return css_mtime > scss_mtime
 
 
 __all__ = ["create_all", "uploadr_cli"]
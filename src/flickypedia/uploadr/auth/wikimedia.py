@@ -68,7 +68,7 @@ import uuid
 from authlib.integrations.httpx_client import OAuth1Client, OAuth2Client
 from authlib.oauth2.rfc6749.wrappers import OAuth2Token
 from cryptography.fernet import Fernet
-from flask import abort, current_app, flash, redirect, request, session, url_for
+from flask import abort, current_app, flash, g, redirect, request, session, url_for
 from flask_login import (
     LoginManager,
     UserMixin,
@@ -206,7 +206,19 @@ class WikimediaUserSession(UserMixin, user_db.Model):  # type: ignore
     def wikimedia_api(self) -> WikimediaApi:
         """
         Returns a Wikimedia API client which is authenticated for this user.
+
+        The client is reused for the rest of the request -- e.g. when
+        we validate the title of every photo on the "prepare info" page,
+        we only need to decrypt the user's token and create an OAuth
+        client once, not once per photo.
         """
+        cached_apis: dict[str, WikimediaApi] = g.setdefault("wikimedia_apis", {})
+
+        try:
+            return cached_apis[self.id]
+        except KeyError:
+            pass
+
         client: httpx.Client
 
         try:
@@ -218,7 +230,10 @@ class WikimediaUserSession(UserMixin, user_db.Model):  # type: ignore
             assert current_app.config["TESTING"]
             client = httpx.Client()
 
-        return WikimediaApi(client=client)
+        api = WikimediaApi(client=client)
+        cached_apis[self.id] = api
+
+        return api
 
     def store_flickr_oauth_token(self, token: str) -> None:
         """
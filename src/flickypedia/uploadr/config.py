@@ -2,6 +2,8 @@ import os
 import pathlib
 from typing import Any
 
+from flickypedia.apis import USER_AGENT
+
 
 def create_config(data_directory: pathlib.Path) -> dict[str, Any]:
     """
@@ -64,7 +66,7 @@ def create_config(data_directory: pathlib.Path) -> dict[str, Any]:
         "PHOTOS_PER_PAGE": 100,
         #
         # A User-Agent sent on HTTP requests
-        "USER_AGENT": "Flickypedia/0.1 (https://commons.wikimedia.org/wiki/Commons:Flickypedia; hello@flickr.org)",
+        "USER_AGENT": USER_AGENT,
     }
 
 
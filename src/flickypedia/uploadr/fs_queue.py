@@ -17,17 +17,19 @@ the filesystem.  See the comments in ``process_single_task()``.
 """
 
 import abc
+import atexit
 import datetime
-import json
 import logging
+import logging.handlers
 import os
 import pathlib
+import queue
 import time
 from typing import Generic, Literal, TypedDict, TypeVar
 import uuid
 
 from flickypedia.types import validate_typeddict
-from flickypedia.utils import DatetimeDecoder, DatetimeEncoder
+from flickypedia.utils import dump_json_with_datetimes, load_json_with_datetimes
 
 
 In = TypeVar("In")
@@ -36,6 +38,10 @@ Out = TypeVar("Out")
 
 State = Literal["waiting", "in_progress", "failed", "completed"]
 
+# The order we look through the state folders when we're looking
+# for a task.
+ALL_STATES: tuple[State, ...] = ("waiting", "in_progress", "failed", "completed")
+
 
 class TaskEvent(TypedDict):
     time: datetime.datetime
@@ -95,21 +101,48 @@ class AbstractFilesystemTaskQueue(abc.ABC, Generic[In, Out]):
         self.logger = logging.getLogger(name=str(base_dir))
         self.configure_logger()
 
+        # A map from task ID to the state folder where we last saw it.
+        #
+        # This lets us go straight to the right file in ``read_task``,
+        # rather than trying each folder in turn.  It's only a hint --
+        # other processes can move tasks without us knowing -- so if the
+        # file isn't where we expect, we fall back to looking everywhere.
+        #
+        # We only track tasks which are still waiting or in progress --
+        # the worker's queue object lives as long as the process, so if
+        # we kept every finished task, this map would grow forever.
+        self._state_index: dict[str, State] = {}
+
     @property
     def logfile_path(self) -> pathlib.Path:
         return self.base_dir / "queue.log"
 
     def configure_logger(self) -> None:
+        # Loggers are shared by name across the whole process, and we may
+        # create many queue objects for the same directory (e.g. one per
+        # request in the web app) -- so we only add the handler once,
+        # otherwise every message would be written once per queue object.
+        if self.logger.handlers:
+            return
+
         self.logger.setLevel(level=logging.DEBUG)
 
         pid = os.getpid()
 
-        handler = logging.FileHandler(filename=self.logfile_path)
-        handler.setFormatter(
+        file_handler = logging.FileHandler(filename=self.logfile_path)
+        file_handler.setFormatter(
             fmt=logging.Formatter(f"%(asctime)s - {pid} - %(levelname)s - %(message)s")
         )
 
-        self.logger.addHandler(handler)
+        # We write to the log file on a background thread, so logging
+        # a message doesn't block the worker on a disk write.
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     @property
     def directories(self) -> set[pathlib.Path]:
@@ -157,8 +190,8 @@ class AbstractFilesystemTaskQueue(abc.ABC, Generic[In, Out]):
         # The use of exclusive file mode "x" means we'll throw if this
         # tmp file already exists -- this seems unlikely, but might
         # indicate another process is working on this file.
-        with open(tmp_path, "x") as tmp_file:
-            tmp_file.write(json.dumps(task, cls=DatetimeEncoder))
+        with open(tmp_path, "xb") as tmp_file:
+            tmp_file.write(dump_json_with_datetimes(task))
 
         # If the task is changing state, we need to make sure we remove
         # the task in the previous folder.
@@ -172,35 +205,68 @@ class AbstractFilesystemTaskQueue(abc.ABC, Generic[In, Out]):
         #
         # Note that ``os.rename()`` is atomic, which is how we get
         # atomic-like file writes.
-        try:
-            prior_task = self.read_task(task_id=task["id"])
-        except ValueError:
-            prior_task = None
+        prior_state = self._find_task_state(task_id=task["id"], hint=task["state"])
 
-        if prior_task is not None and prior_task["state"] != task["state"]:
-            prior_path = self.base_dir / prior_task["state"] / filename
+        if prior_state is not None and prior_state != task["state"]:
+            prior_path = self.base_dir / prior_state / filename
             os.rename(tmp_path, prior_path)
             os.rename(prior_path, out_path)
         else:
             os.rename(tmp_path, out_path)
 
+        self._remember_task_state(task_id=task["id"], state=task["state"])
+
+    def _remember_task_state(self, task_id: str, state: State) -> None:
+        """
+        Record which state folder a task is in, or forget about it
+        if the task is finished.
+        """
+        if state in {"completed", "failed"}:
+            self._state_index.pop(task_id, None)
+        else:
+            self._state_index[task_id] = state
+
+    def _find_task_state(self, task_id: str, *, hint: State) -> State | None:
+        """
+        Returns the state of the task currently saved on disk, or None
+        if it hasn't been saved yet.
+
+        We only need to know which folder the file is in, so we check
+        for its existence rather than reading and parsing it.
+
+        We look in the ``hint`` folder first -- usually this is the state
+        we're about to write, and most writes don't change the state.
+        """
+        states: tuple[State, ...] = (hint, *(s for s in ALL_STATES if s != hint))
+
+        for state in states:
+            if os.path.exists(self.base_dir / state / task_id):
+                return state
+
+        return None
+
     def read_task(self, task_id: str) -> Task[In, Out]:
         """
         Return the state of a currently running task.
         """
-        for dirname in [
-            self.waiting_dir,
-            self.in_progress_dir,
-            self.failed_dir,
-            self.completed_dir,
-        ]:
+        try:
+            hint = self._state_index[task_id]
+        except KeyError:
+            states = ALL_STATES
+        else:
+            states = (hint, *(s for s in ALL_STATES if s != hint))
+
+        for state in states:
             try:
-                with open(dirname / task_id) as in_file:
-                    t = json.load(in_file, cls=DatetimeDecoder)
-                    return validate_typeddict(t, model=Task[In, Out])
+                with open(self.base_dir / state / task_id, "rb") as in_file:
+                    t = load_json_with_datetimes(in_file.read())
             except FileNotFoundError:
-                pass
+                continue
 
+            self._remember_task_state(task_id=task_id, state=state)
+            return validate_typeddict(t, model=Task[In, Out])
+
+        self._state_index.pop(task_id, None)
         raise ValueError(f"Could not find task with ID {task_id}")
 
     def start_task(
@@ -249,22 +315,25 @@ class AbstractFilesystemTaskQueue(abc.ABC, Generic[In, Out]):
         """
         Returns the ID of the next available task (if any).
         """
-        # A list of tuples (filename, modified time)
-        candidates = []
-
-        for filename in os.listdir(self.waiting_dir):
-            try:
-                candidates.append(
-                    (filename, os.path.getmtime(self.waiting_dir / filename))
-                )
-            except FileNotFoundError:
-                pass
-
-        try:
-            filename, _ = min(candidates, key=lambda fm: fm[1])
-            return filename
-        except ValueError:
-            return None
+        # We only need the oldest task, so we keep a running minimum
+        # rather than collecting every (filename, modified time) pair.
+        oldest_filename = None
+        oldest_mtime = None
+
+        # Note: the stat() call can fail if another worker picks up
+        # the task between us listing the folder and checking its mtime.
+        with os.scandir(self.waiting_dir) as entries:
+            for entry in entries:
+                try:
+                    mtime = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+
+                if oldest_mtime is None or mtime < oldest_mtime:
+                    oldest_filename = entry.name
+                    oldest_mtime = mtime
+
+        return oldest_filename
 
     def process_single_task(self) -> str | None:
         """
@@ -309,6 +378,8 @@ class AbstractFilesystemTaskQueue(abc.ABC, Generic[In, Out]):
             )
             return None
 
+        self._remember_task_state(task_id=this_task_id, state="in_progress")
+
         # Now actually start working on the task.
         task = self.read_task(task_id=this_task_id)
 
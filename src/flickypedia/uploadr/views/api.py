@@ -1,7 +1,8 @@
 import functools
 
-from flask import abort, jsonify, request
+from flask import abort, jsonify, request, Response
 from flask_login import current_user, login_required
+import orjson
 
 from flickypedia.apis.wikimedia import top_n_languages, LanguageMatch
 from flickypedia.types.views import ViewResponse
@@ -57,6 +58,17 @@ def find_matching_categories_api() -> ViewResponse:
     return jsonify(result)
 
 
+# The languages we suggest before the user has typed anything.  These
+# never change while the app is running, so we serialise them once
+# rather than on every request.
+DEFAULT_LANGUAGES_JSON = orjson.dumps(
+    [
+        {"id": lang_id, "label": label, "match_text": None}
+        for lang_id, label in top_n_languages(n=10)
+    ]
+)
+
+
 @functools.lru_cache(maxsize=128)
 def find_matching_languages(query: str) -> list[LanguageMatch]:
     """
@@ -78,12 +90,7 @@ def find_matching_languages_api() -> ViewResponse:
     query = request.args.get("query")
 
     if not query:
-        return jsonify(
-            [
-                {"id": lang_id, "label": label, "match_text": None}
-                for lang_id, label in top_n_languages(n=10)
-            ]
-        )
+        return Response(DEFAULT_LANGUAGES_JSON, mimetype="application/json")
 
     result = find_matching_languages(query)
 
@@ -1,6 +1,16 @@
+import threading
+
 from flickr_photos_api import User as FlickrUser
+import httpx
+import pytest
 
-from flickypedia.apis.flickr_user_ids import lookup_flickr_user_in_wikidata
+from flickypedia.apis import flickr_user_ids
+from flickypedia.apis.flickr_user_ids import (
+    clear_user_cache,
+    find_wikidata_entities_with_flickr_ids,
+    lookup_flickr_user_in_wikidata,
+    WikidataEntityLookup,
+)
 
 
 def test_can_find_user_by_user_id(vcr_cassette: str) -> None:
@@ -53,3 +63,216 @@ def test_returns_none_if_it_cannot_find_user_with_only_id(vcr_cassette: str) ->
     }
 
     assert lookup_flickr_user_in_wikidata(user) is None
+
+
+@pytest.fixture
+def empty_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Empty the lookup table cache for the duration of the test.
+
+    We record the current value with monkeypatch first, so it gets
+    restored afterwards and we don't affect other tests.
+    """
+    monkeypatch.setattr(
+        flickr_user_ids, "_cached_lookup", flickr_user_ids._cached_lookup
+    )
+    clear_user_cache()
+
+
+def test_returns_none_for_malformed_user_id_without_path_alias(
+    empty_cache: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_fetch() -> WikidataEntityLookup:
+        raise AssertionError("Should not fetch the lookup table")
+
+    monkeypatch.setattr(
+        flickr_user_ids, "_fetch_wikidata_entities_with_flickr_ids", failing_fetch
+    )
+
+    user: FlickrUser = {
+        "id": "not-a-flickr-user-id",
+        "photos_url": "https://www.flickr.com/photos/not-a-flickr-user-id/",
+        "profile_url": "https://www.flickr.com/people/not-a-flickr-user-id/",
+        "realname": None,
+        "username": "not-a-flickr-user-id",
+        "path_alias": None,
+    }
+
+    assert lookup_flickr_user_in_wikidata(user) is None
+
+
+def test_finds_user_with_malformed_user_id_by_path_alias(
+    empty_cache: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_fetch() -> WikidataEntityLookup:
+        return {
+            "by_user_id": {"not-a-flickr-user-id": "Q1"},
+            "by_pathalias": {"example_alias": "Q2"},
+        }
+
+    monkeypatch.setattr(
+        flickr_user_ids, "_fetch_wikidata_entities_with_flickr_ids", fake_fetch
+    )
+
+    user: FlickrUser = {
+        "id": "not-a-flickr-user-id",
+        "photos_url": "https://www.flickr.com/photos/example_alias/",
+        "profile_url": "https://www.flickr.com/people/example_alias/",
+        "realname": None,
+        "username": "example_alias",
+        "path_alias": "example_alias",
+    }
+
+    assert lookup_flickr_user_in_wikidata(user) == "Q2"
+
+
+class TestLookupTableCache:
+    @pytest.fixture
+    def fetches(self, monkeypatch: pytest.MonkeyPatch) -> list[WikidataEntityLookup]:
+        """
+        Replace the fetch from Wikidata with a stub that returns a new
+        lookup table every time, and records every table it returns.
+
+        We also empty the cache for the duration of the test, and restore
+        it afterwards so we don't affect other tests.
+        """
+        fetches: list[WikidataEntityLookup] = []
+
+        def fake_fetch() -> WikidataEntityLookup:
+            lookup: WikidataEntityLookup = {
+                "by_user_id": {"12345678@N01": f"Q{len(fetches)}"},
+                "by_pathalias": {},
+            }
+            fetches.append(lookup)
+            return lookup
+
+        monkeypatch.setattr(flickr_user_ids, "_cached_lookup", None)
+        monkeypatch.setattr(
+            flickr_user_ids, "_fetch_wikidata_entities_with_flickr_ids", fake_fetch
+        )
+
+        return fetches
+
+    def test_caches_the_lookup_table(self, fetches: list[WikidataEntityLookup]) -> None:
+        first = find_wikidata_entities_with_flickr_ids()
+        second = find_wikidata_entities_with_flickr_ids()
+
+        assert first is second
+        assert len(fetches) == 1
+
+    def test_refetches_after_the_cache_expires(
+        self, fetches: list[WikidataEntityLookup], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        find_wikidata_entities_with_flickr_ids()
+
+        monkeypatch.setattr(flickr_user_ids, "CACHE_TTL", 0)
+        lookup = find_wikidata_entities_with_flickr_ids()
+
+        assert len(fetches) == 2
+        assert lookup is fetches[1]
+
+    def test_refetches_after_clearing_the_cache(
+        self, fetches: list[WikidataEntityLookup]
+    ) -> None:
+        find_wikidata_entities_with_flickr_ids()
+
+        clear_user_cache()
+        lookup = find_wikidata_entities_with_flickr_ids()
+
+        assert len(fetches) == 2
+        assert lookup is fetches[1]
+
+    def test_keeps_stale_table_if_refetch_fails(
+        self, fetches: list[WikidataEntityLookup], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        stale_lookup = find_wikidata_entities_with_flickr_ids()
+
+        def failing_fetch() -> WikidataEntityLookup:
+            raise httpx.ConnectTimeout("WDQS is down")
+
+        monkeypatch.setattr(flickr_user_ids, "CACHE_TTL", 0)
+        monkeypatch.setattr(
+            flickr_user_ids, "_fetch_wikidata_entities_with_flickr_ids", failing_fetch
+        )
+
+        assert find_wikidata_entities_with_flickr_ids() is stale_lookup
+
+    def test_returns_stale_table_while_another_thread_refreshes(
+        self, fetches: list[WikidataEntityLookup], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        stale_lookup = find_wikidata_entities_with_flickr_ids()
+
+        refresh_started = threading.Event()
+        finish_refresh = threading.Event()
+
+        def slow_fetch() -> WikidataEntityLookup:
+            refresh_started.set()
+            finish_refresh.wait(timeout=5)
+            return {"by_user_id": {}, "by_pathalias": {}}
+
+        monkeypatch.setattr(flickr_user_ids, "CACHE_TTL", 0)
+        monkeypatch.setattr(
+            flickr_user_ids, "_fetch_wikidata_entities_with_flickr_ids", slow_fetch
+        )
+
+        refresher = threading.Thread(target=find_wikidata_entities_with_flickr_ids)
+        refresher.start()
+        assert refresh_started.wait(timeout=5)
+
+        # If this waited for the refresh, it would block until the slow
+        # fetch timed out, and then get the new table.
+        try:
+            assert find_wikidata_entities_with_flickr_ids() is stale_lookup
+        finally:
+            finish_refresh.set()
+            refresher.join()
+
+    def test_waits_for_the_first_fetch_if_there_is_no_table(
+        self, fetches: list[WikidataEntityLookup], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        fetch_started = threading.Event()
+        finish_fetch = threading.Event()
+
+        def slow_fetch() -> WikidataEntityLookup:
+            fetch_started.set()
+            finish_fetch.wait(timeout=5)
+            lookup: WikidataEntityLookup = {"by_user_id": {}, "by_pathalias": {}}
+            fetches.append(lookup)
+            return lookup
+
+        monkeypatch.setattr(
+            flickr_user_ids, "_fetch_wikidata_entities_with_flickr_ids", slow_fetch
+        )
+
+        results: list[WikidataEntityLookup] = []
+
+        def find_in_thread() -> None:
+            results.append(find_wikidata_entities_with_flickr_ids())
+
+        first = threading.Thread(target=find_in_thread)
+        first.start()
+        assert fetch_started.wait(timeout=5)
+
+        second = threading.Thread(target=find_in_thread)
+        second.start()
+
+        finish_fetch.set()
+        first.join()
+        second.join()
+
+        # Both threads get the same table, which we only fetched once.
+        assert len(fetches) == 1
+        assert results == [fetches[0], fetches[0]]
+        assert results[0] is results[1]
+
+    def test_raises_if_first_fetch_fails(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def failing_fetch() -> WikidataEntityLookup:
+            raise httpx.ConnectTimeout("WDQS is down")
+
+        monkeypatch.setattr(flickr_user_ids, "_cached_lookup", None)
+        monkeypatch.setattr(
+            flickr_user_ids, "_fetch_wikidata_entities_with_flickr_ids", failing_fetch
+        )
+
+        with pytest.raises(httpx.ConnectTimeout):
+            find_wikidata_entities_with_flickr_ids()
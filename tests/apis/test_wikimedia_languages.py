@@ -1,4 +1,9 @@
-from flickypedia.apis.wikimedia.languages import order_language_list
+from flickypedia.apis.wikimedia.languages import (
+    LANGUAGE_FREQUENCIES,
+    SUPPORTED_LANGUAGES,
+    order_language_list,
+    top_n_languages,
+)
 
 
 def test_order_language_list() -> None:
@@ -30,3 +35,37 @@ def test_order_language_list() -> None:
         {"id": "sco", "label": "Scots", "match_text": "escocès"},
         {"id": "myv", "label": "эрзянь", "match_text": "esiya — èdè esiya"},
     ]
+
+
+def test_order_language_list_with_empty_query() -> None:
+    results = {
+        "avk": "kotava",
+        "fr": "french",
+        "en-simple": "simple english",
+        "de": "german",
+    }
+
+    language_list = order_language_list(query="", results=results)
+
+    assert language_list == [
+        {"id": "de", "label": "Deutsch", "match_text": None},
+        {"id": "fr", "label": "français", "match_text": None},
+        {"id": "avk", "label": "Kotava", "match_text": None},
+    ]
+
+
+def test_top_n_languages() -> None:
+    assert top_n_languages(n=3) == [
+        ("en", "English"),
+        ("de", "Deutsch"),
+        ("fr", "français"),
+    ]
+
+
+def test_top_n_languages_are_supported_and_sorted() -> None:
+    result = top_n_languages(n=len(LANGUAGE_FREQUENCIES))
+
+    assert all(SUPPORTED_LANGUAGES[lang_id] == label for lang_id, label in result)
+
+    frequencies = [LANGUAGE_FREQUENCIES[lang_id] for lang_id, _ in result]
+    assert frequencies == sorted(frequencies, reverse=True)
@@ -15,6 +15,8 @@ from flickypedia.utils import (
     get_required_password,
     DatetimeDecoder,
     DatetimeEncoder,
+    dump_json_with_datetimes,
+    load_json_with_datetimes,
 )
 from utils import InMemoryKeyring
 
@@ -39,6 +41,26 @@ def test_can_json_round_trip() -> None:
     assert parsed_json_string == d
 
 
+def test_can_json_round_trip_with_orjson() -> None:
+    d = {
+        "label": "an interesting time",
+        "events": [
+            {"time": datetime.datetime(2001, 2, 3, 4, 5, 6), "description": "hi"}
+        ],
+    }
+
+    json_bytes = dump_json_with_datetimes(d)
+
+    assert load_json_with_datetimes(json_bytes) == d
+    assert json.loads(json_bytes, cls=DatetimeDecoder) == d
+    assert load_json_with_datetimes(json.dumps(d, cls=DatetimeEncoder)) == d
+
+
+def test_dump_json_with_datetimes_rejects_unknown_types() -> None:
+    with pytest.raises(TypeError):
+        dump_json_with_datetimes({"date": datetime.date(2001, 2, 3)})
+
+
 class TestGetRequiredPassword:
     def test_gets_existing_password(self) -> None:
         keyring.set_keyring(
@@ -1,8 +1,12 @@
+import os
+import pathlib
 from urllib.parse import urlencode
 
 from flask.testing import FlaskClient
 import pytest
 
+from flickypedia.uploadr import compile_scss
+
 
 def test_homepage(client: FlaskClient) -> None:
     resp = client.get("/")
@@ -34,3 +38,40 @@ def test_redirected_to_homepage_for_pages_requiring_login(
 
     params = urlencode({"next": path})
     assert resp.headers["location"] == f"/?{params}"
+
+
+class TestCompileScss:
+    @pytest.fixture
+    def static_folder(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        (tmp_path / "assets").mkdir()
+        (tmp_path / "assets" / "style.scss").write_text(
+            '@import "colours.scss";\nbody { color: $text-colour; }'
+        )
+        (tmp_path / "assets" / "colours.scss").write_text("$text-colour: red;")
+
+        return tmp_path
+
+    def test_compiles_css(self, static_folder: pathlib.Path) -> None:
+        compile_scss(str(static_folder))
+
+        assert "color: red" in (static_folder / "style.css").read_text()
+
+    def test_skips_compiling_if_css_is_up_to_date(
+        self, static_folder: pathlib.Path
+    ) -> None:
+        compile_scss(str(static_folder))
+        mtime = os.path.getmtime(static_folder / "style.css")
+
+        compile_scss(str(static_folder))
+        assert os.path.getmtime(static_folder / "style.css") == mtime
+
+    def test_recompiles_if_a_partial_changes(self, static_folder: pathlib.Path) -> None:
+        compile_scss(str(static_folder))
+        css_mtime = os.path.getmtime(static_folder / "style.css")
+
+        colours_path = static_folder / "assets" / "colours.scss"
+        colours_path.write_text("$text-colour: blue;")
+        os.utime(colours_path, (css_mtime + 1, css_mtime + 1))
+
+        compile_scss(str(static_folder))
+        assert "color: blue" in (static_folder / "style.css").read_text()
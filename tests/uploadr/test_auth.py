@@ -299,3 +299,11 @@ class TestLoadUser:
             user = store_user(token)
 
             assert load_user(userid=user.id) == user
+
+
+def test_wikimedia_api_is_reused_within_a_request(app: Flask) -> None:
+    with app.test_request_context():
+        user = store_user()
+        api = user.wikimedia_api()
+
+        assert user.wikimedia_api() is api
@@ -124,3 +124,47 @@ def test_handles_failure_in_the_process_method(tmp_path: pathlib.Path) -> None:
         "Task started",
         "Task failed with an exception: BOOM!",
     ]
+
+
+def test_can_read_task_moved_by_another_worker(tmp_path: pathlib.Path) -> None:
+    """
+    If another process moves a task to a different state, we can still
+    read it, even though this queue last saw it in a different folder.
+    """
+    web_queue = AddingQueue(base_dir=tmp_path)
+    worker_queue = AddingQueue(base_dir=tmp_path)
+
+    task_id = web_queue.start_task(task_input=[1, 2, 3], task_output=-1)
+    assert web_queue.read_task(task_id=task_id)["state"] == "waiting"
+
+    worker_queue.process_single_task()
+
+    task = web_queue.read_task(task_id=task_id)
+    assert task["state"] == "completed"
+    assert task["task_output"] == 6
+
+
+def test_forgets_the_state_of_finished_tasks(queue: AddingQueue) -> None:
+    task_id = queue.start_task(task_input=[1, 2, 3], task_output=-1)
+    assert queue._state_index == {task_id: "waiting"}
+
+    queue.process_single_task()
+    assert queue._state_index == {}
+
+    assert queue.read_task(task_id=task_id)["state"] == "completed"
+    assert queue._state_index == {}
+
+
+def test_reading_a_nonexistent_task_is_an_error(queue: AddingQueue) -> None:
+    with pytest.raises(ValueError, match="Could not find task"):
+        queue.read_task(task_id="does-not-exist")
+
+
+def test_creating_multiple_queues_only_adds_one_log_handler(
+    tmp_path: pathlib.Path,
+) -> None:
+    queue1 = AddingQueue(base_dir=tmp_path)
+    queue2 = AddingQueue(base_dir=tmp_path)
+
+    assert queue1.logger is queue2.logger
+    assert len(queue1.logger.handlers) == 1